@@ -36,18 +36,17 @@ async def get_unique_years():
 @router.get("/columns")
 async def get_available_columns():
     """Get all available columns in the dataset"""
-    df = data_loader.load_data()
+    column_types = data_loader.get_column_types()
     return {
-        "columns": df.columns.tolist(),
-        "numeric_columns": df.select_dtypes(include=['number']).columns.tolist(),
-        "categorical_columns": df.select_dtypes(include=['object']).columns.tolist()
+        "columns": data_loader.get_columns(),
+        "numeric_columns": column_types["numeric"],
+        "categorical_columns": column_types["categorical"]
     }
 
 @router.get("/metrics")
 async def get_available_metrics():
     """Get all available crime and economic metrics"""
-    df = data_loader.load_data()
-    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    numeric_cols = data_loader.get_column_types()["numeric"]
     
     # Categorize metrics
     crime_metrics = [col for col in numeric_cols if any(term in col.lower() for term in ['crime', 'murder', 'rape', 'robbery', 'assault', 'burglary', 'larceny', 'theft'])]
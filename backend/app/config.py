@@ -22,6 +22,23 @@ class Settings(BaseSettings):
     # Data Settings
     DATA_FILE_PATH: str = str(Path(__file__).parent.parent / "data" / "merged_crime_gdp_population.csv")
     
+    # Storage Settings
+    # "pandas" keeps the whole dataset in memory, "sqlite" keeps it in an
+    # indexed on-disk database built from DATA_FILE_PATH on first use
+    STORAGE_BACKEND: str = "pandas"
+    SQLITE_DB_PATH: str = str(Path(__file__).parent.parent / "data" / "merged_crime_gdp_population.sqlite")
+    STORAGE_CHUNK_SIZE: int = 50000
+    
+    # Parallel Execution Settings
+    # In-memory datasets with at least PARALLEL_ROW_THRESHOLD rows are split
+    # by PARALLEL_PARTITION_COLUMN and filtered/aggregated on a process pool
+    # of PARALLEL_WORKERS processes (0 = one per CPU core, 1 = disabled).
+    # Disabled by default: multi-core scaling has not been measured yet, see
+    # the README and `python -m benchmarks.parallel_scaling`
+    PARALLEL_ROW_THRESHOLD: int = 3000000
+    PARALLEL_WORKERS: int = 1
+    PARALLEL_PARTITION_COLUMN: str = "State_Name"
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,12 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import data, filter, aggregate, statistics
 from app.config import settings
+from app.services.data_loader import data_loader
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load or ingest the dataset (and start any worker processes) before
+    # serving, rather than inside the first request, and release them on
+    # shutdown so workers do not outlive the app across reloads
+    data_loader.storage.open()
+    yield
+    data_loader.storage.close()
 
 app = FastAPI(
     title=settings.API_TITLE,
     description="API for interactive crime, GDP, and population data visualization",
-    version=settings.API_VERSION
+    version=settings.API_VERSION,
+    lifespan=lifespan
 )
 
 # CORS middleware - allow frontend to access API
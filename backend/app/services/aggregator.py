@@ -4,7 +4,7 @@ from app.services.data_loader import data_loader
 
 class Aggregator:
     def __init__(self):
-        self.df = data_loader.load_data()
+        self.storage = data_loader.storage
     
     def aggregate_by_state(
         self,
@@ -12,10 +12,10 @@ class Aggregator:
         metrics: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """Aggregate data by state"""
-        data = self.df.copy()
+        conditions = []
         
         if years:
-            data = data[data['Year'].isin(years)]
+            conditions.append(('Year', 'in', years))
         
         default_metrics = {
             'Violent_Crime_Rate': 'mean',
@@ -30,29 +30,26 @@ class Aggregator:
         if metrics:
             agg_dict = {k: v for k, v in default_metrics.items() if k in metrics}
         
-        aggregated = data.groupby('State_Name').agg(agg_dict).reset_index()
-        return aggregated
+        return self.storage.aggregate(['State_Name'], agg_dict, conditions)
     
     def aggregate_by_year(
         self,
         states: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """Aggregate data by year"""
-        data = self.df.copy()
+        conditions = []
         
         if states:
-            data = data[data['State_Name'].isin(states)]
+            conditions.append(('State_Name', 'in', states))
         
-        aggregated = data.groupby('Year').agg({
+        return self.storage.aggregate(['Year'], {
             'Violent_Crime_Rate': 'mean',
             'Property_Crime_Rate': 'mean',
             'GDP_Per_Capita': 'mean',
             'Population': 'sum',
             'Violent crime': 'sum',
             'Property crime': 'sum'
-        }).reset_index()
-        
-        return aggregated
+        }, conditions)
     
     def aggregate_by_county(
         self,
@@ -60,21 +57,19 @@ class Aggregator:
         years: Optional[List[int]] = None
     ) -> pd.DataFrame:
         """Aggregate data by county within a state"""
-        data = self.df[self.df['State_Name'] == state].copy()
+        conditions = [('State_Name', '==', state)]
         
         if years:
-            data = data[data['Year'].isin(years)]
+            conditions.append(('Year', 'in', years))
         
-        aggregated = data.groupby('County_Clean').agg({
+        return self.storage.aggregate(['County_Clean'], {
             'Violent_Crime_Rate': 'mean',
             'Property_Crime_Rate': 'mean',
             'GDP_Per_Capita': 'mean',
             'Population': 'mean',
             'Violent crime': 'sum',
             'Property crime': 'sum'
-        }).reset_index()
-        
-        return aggregated
+        }, conditions)
     
     def get_time_series(
         self,
@@ -83,20 +78,19 @@ class Aggregator:
         metric: str = 'Violent_Crime_Rate'
     ) -> pd.DataFrame:
         """Get time series data for a specific location and metric"""
-        data = self.df.copy()
+        conditions = []
         
         if state:
-            data = data[data['State_Name'] == state]
+            conditions.append(('State_Name', '==', state))
         if county:
-            data = data[data['County_Clean'] == county]
+            conditions.append(('County_Clean', '==', county))
         
-        if metric not in data.columns:
+        if metric not in self.storage.get_columns():
             metric = 'Violent_Crime_Rate'
         
-        time_series = data.groupby('Year')[metric].mean().reset_index()
+        time_series = self.storage.aggregate(['Year'], {metric: 'mean'}, conditions)
         time_series.columns = ['Year', 'Value']
         
         return time_series
 
 aggregator = Aggregator()
-
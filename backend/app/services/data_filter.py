@@ -4,7 +4,7 @@ from app.services.data_loader import data_loader
 
 class DataFilter:
     def __init__(self):
-        self.df = data_loader.load_data()
+        self.storage = data_loader.storage
     
     def filter_data(
         self,
@@ -22,56 +22,45 @@ class DataFilter:
         metric_filters: Optional[dict] = None
     ) -> pd.DataFrame:
         """Apply multiple filters to the dataset"""
-        filtered = self.df.copy()
+        conditions = []
         
         if states:
-            filtered = filtered[filtered['State_Name'].isin(states)]
+            conditions.append(('State_Name', 'in', states))
         
         if counties:
-            filtered = filtered[filtered['County_Clean'].isin(counties)]
+            conditions.append(('County_Clean', 'in', counties))
         
         if years:
-            filtered = filtered[filtered['Year'].isin(years)]
+            conditions.append(('Year', 'in', years))
         
-        if gdp_min is not None:
-            filtered = filtered[filtered['GDP_Per_Capita'] >= gdp_min]
-        
-        if gdp_max is not None:
-            filtered = filtered[filtered['GDP_Per_Capita'] <= gdp_max]
-        
-        if pop_min is not None:
-            filtered = filtered[filtered['Population'] >= pop_min]
-        
-        if pop_max is not None:
-            filtered = filtered[filtered['Population'] <= pop_max]
-        
-        if violent_crime_min is not None:
-            filtered = filtered[filtered['Violent_Crime_Rate'] >= violent_crime_min]
-        
-        if violent_crime_max is not None:
-            filtered = filtered[filtered['Violent_Crime_Rate'] <= violent_crime_max]
-        
-        if property_crime_min is not None:
-            filtered = filtered[filtered['Property_Crime_Rate'] >= property_crime_min]
-        
-        if property_crime_max is not None:
-            filtered = filtered[filtered['Property_Crime_Rate'] <= property_crime_max]
+        ranges = [
+            ('GDP_Per_Capita', gdp_min, gdp_max),
+            ('Population', pop_min, pop_max),
+            ('Violent_Crime_Rate', violent_crime_min, violent_crime_max),
+            ('Property_Crime_Rate', property_crime_min, property_crime_max)
+        ]
+        for column, low, high in ranges:
+            if low is not None:
+                conditions.append((column, '>=', low))
+            if high is not None:
+                conditions.append((column, '<=', high))
         
         # Apply dynamic metric filters (for any column with min/max)
         if metric_filters:
+            columns = self.storage.get_columns()
             for metric, range_dict in metric_filters.items():
-                if metric in filtered.columns:
+                if metric in columns:
                     if 'min' in range_dict and range_dict['min'] is not None:
-                        filtered = filtered[filtered[metric] >= range_dict['min']]
+                        conditions.append((metric, '>=', range_dict['min']))
                     if 'max' in range_dict and range_dict['max'] is not None:
-                        filtered = filtered[filtered[metric] <= range_dict['max']]
+                        conditions.append((metric, '<=', range_dict['max']))
         
-        return filtered
+        return self.storage.query(conditions=conditions)
     
     def get_counties_by_state(self, state: str) -> List[str]:
         """Get all counties for a given state"""
-        return sorted(
-            self.df[self.df['State_Name'] == state]['County_Clean'].unique().tolist()
+        return self.storage.get_unique_values(
+            'County_Clean', conditions=[('State_Name', '==', state)]
         )
 
 data_filter = DataFilter()
@@ -0,0 +1,217 @@
+import multiprocessing
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from app.services.storage import Condition, condition_mask
+
+# Aggregates that can be computed per partition and merged afterwards.
+# 'mean' is carried as a sum and a count and divided after the merge.
+PARTIAL_AGGREGATES = {
+    'mean': [('sum', 'sum'), ('count', 'sum')],
+    'sum': [('sum', 'sum')],
+    'count': [('count', 'sum')],
+    'min': [('min', 'min')],
+    'max': [('max', 'max')]
+}
+
+# State inherited by each worker process: the shared dataset, sorted so that
+# each partition is a contiguous block of rows, and the (start, stop) row
+# range of each partition within it
+_data: Optional[pd.DataFrame] = None
+_partitions: Dict[Any, Tuple[int, int]] = {}
+
+def _init_worker(data: pd.DataFrame, partitions: Dict[Any, Tuple[int, int]]):
+    global _data, _partitions
+    _data = data
+    _partitions = partitions
+
+def _ready() -> bool:
+    return _data is not None
+
+def _slices(keys: List[Any]) -> Iterator[Tuple[int, pd.DataFrame]]:
+    """Yield the row slices of a batch, joining adjacent partitions.
+    
+    Slicing a row range does not copy the data, so a batch of neighbouring
+    partitions is read straight out of the shared frame.
+    """
+    ranges: List[List[int]] = []
+    for start, stop in sorted(_partitions[key] for key in keys):
+        if ranges and ranges[-1][1] == start:
+            ranges[-1][1] = stop
+        else:
+            ranges.append([start, stop])
+    for start, stop in ranges:
+        yield start, _data.iloc[start:stop]
+
+def _filter_batch(keys: List[Any], conditions: List[Condition]) -> np.ndarray:
+    """Return the positions of the matching rows in a batch"""
+    return np.concatenate([
+        start + np.flatnonzero(condition_mask(part, conditions).to_numpy())
+        for start, part in _slices(keys)
+    ])
+
+def _aggregate_batch(
+    keys: List[Any],
+    by: List[str],
+    partial_agg: Dict[str, Tuple[str, str]],
+    conditions: List[Condition]
+) -> Optional[pd.DataFrame]:
+    """Compute the partial aggregates of a batch of partitions"""
+    columns = list(dict.fromkeys(by + [column for column, _ in partial_agg.values()]))
+    partials = []
+    for _, part in _slices(keys):
+        if conditions:
+            # Only the matching rows of the columns used are copied
+            part = part.loc[condition_mask(part, conditions).to_numpy(), columns]
+        if not part.empty:
+            partials.append(part.groupby(by).agg(**partial_agg))
+    if not partials:
+        return None
+    return pd.concat(partials)
+
+def _partial_name(column: str, partial: str) -> str:
+    return f"{column}__{partial}"
+
+class PartitionedExecutor:
+    """Runs filters and groupby aggregates over a process pool.
+    
+    The dataset is sorted once by ``partition_column`` so that every
+    partition is a contiguous ``(start, stop)`` row range; ``data`` is the
+    sorted frame and keeps the original index labels, which give the way
+    back to dataset order. It is handed to every worker once, when the pool
+    starts (with the fork start method it is shared copy-on-write rather
+    than pickled), and tasks take zero-copy slices of it. Partitions are
+    split into one run of neighbouring partitions per worker, balanced by
+    row count, so each worker runs a single filter/groupby per call. Partial
+    results are merged in the parent process.
+    """
+    
+    def __init__(self, df: pd.DataFrame, partition_column: str, workers: int):
+        self.partition_column = partition_column
+        self.workers = workers
+        
+        codes, keys = pd.factorize(df[partition_column], use_na_sentinel=False)
+        if (codes[1:] < codes[:-1]).any():
+            df = df.take(np.argsort(codes, kind='stable'))
+            codes = np.sort(codes)
+        self.data = df
+        counts = np.bincount(codes, minlength=len(keys))
+        stops = np.cumsum(counts)
+        self.partitions = {
+            key: (int(stop - count), int(stop))
+            for key, count, stop in zip(keys, counts, stops)
+        }
+        
+        if 'fork' in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context('fork')
+        else:
+            context = multiprocessing.get_context()
+        self.pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.data, self.partitions)
+        )
+    
+    @staticmethod
+    def supports(agg: Dict[str, str]) -> bool:
+        """Whether every aggregate in ``agg`` can be merged from partials"""
+        return bool(agg) and all(
+            isinstance(func, str) and func in PARTIAL_AGGREGATES
+            for func in agg.values()
+        )
+    
+    def start(self):
+        """Fork every worker now instead of on the first submitted task"""
+        futures = [self.pool.submit(_ready) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+    
+    def filter_positions(self, conditions: List[Condition]) -> np.ndarray:
+        """Return the sorted positions of all matching rows in ``data``"""
+        batches = self._batches(self._prune(conditions))
+        results = list(self.pool.map(
+            _filter_batch, batches, [conditions] * len(batches)
+        ))
+        if not results:
+            return np.array([], dtype=np.intp)
+        return np.sort(np.concatenate(results))
+    
+    def aggregate(
+        self,
+        by: List[str],
+        agg: Dict[str, str],
+        conditions: List[Condition]
+    ) -> Optional[pd.DataFrame]:
+        """Group and aggregate, or return None when no rows match"""
+        partial_agg = {}
+        merge_agg = {}
+        for column, func in agg.items():
+            for partial, merge in PARTIAL_AGGREGATES[func]:
+                name = _partial_name(column, partial)
+                partial_agg[name] = (column, partial)
+                merge_agg[name] = merge
+        
+        batches = self._batches(self._prune(conditions))
+        partials = [
+            result for result in self.pool.map(
+                _aggregate_batch,
+                batches,
+                [by] * len(batches),
+                [partial_agg] * len(batches),
+                [conditions] * len(batches)
+            )
+            if result is not None
+        ]
+        if not partials:
+            return None
+        
+        merged = pd.concat(partials).groupby(level=list(range(len(by)))).agg(merge_agg)
+        
+        result = pd.DataFrame(index=merged.index)
+        for column, func in agg.items():
+            if func == 'mean':
+                result[column] = (
+                    merged[_partial_name(column, 'sum')]
+                    / merged[_partial_name(column, 'count')]
+                )
+            else:
+                name = _partial_name(column, PARTIAL_AGGREGATES[func][0][0])
+                result[column] = merged[name]
+        
+        return result.reset_index()
+    
+    def shutdown(self):
+        self.pool.shutdown()
+    
+    def _batches(self, keys: List[Any]) -> List[List[Any]]:
+        """Split partitions into at most one run per worker, balanced by rows.
+        
+        ``keys`` keep the order of ``partitions``, which is the order of the
+        rows, so each run covers neighbouring partitions.
+        """
+        count = min(self.workers, len(keys))
+        sizes = [stop - start for start, stop in (self.partitions[key] for key in keys)]
+        total = sum(sizes)
+        batches: List[List[Any]] = []
+        filled = 0
+        for key, size in zip(keys, sizes):
+            if not batches or (len(batches) < count and filled >= total * len(batches) / count):
+                batches.append([])
+            batches[-1].append(key)
+            filled += size
+        return batches
+    
+    def _prune(self, conditions: List[Condition]) -> List[Any]:
+        """Skip partitions excluded by a condition on the partition column"""
+        keys = list(self.partitions)
+        for column, op, value in conditions:
+            if column != self.partition_column:
+                continue
+            if op == 'in':
+                allowed = set(value)
+                keys = [key for key in keys if key in allowed]
+            elif op == '==':
+                keys = [key for key in keys if key == value]
+        return keys
@@ -3,10 +3,21 @@ import numpy as np
 from scipy import stats
 from typing import Dict, List, Optional
 from app.services.data_loader import data_loader
+from app.services.storage import Condition
+
+def _filter_conditions(filters: Optional[Dict]) -> List[Condition]:
+    """Translate a states/years filter dict into storage conditions"""
+    conditions = []
+    if filters:
+        if 'states' in filters:
+            conditions.append(('State_Name', 'in', filters['states']))
+        if 'years' in filters:
+            conditions.append(('Year', 'in', filters['years']))
+    return conditions
 
 class StatisticsService:
     def __init__(self):
-        self.df = data_loader.load_data()
+        self.storage = data_loader.storage
     
     def get_correlation_matrix(
         self,
@@ -14,14 +25,8 @@ class StatisticsService:
         filters: Optional[Dict] = None
     ) -> Dict:
         """Calculate correlation matrix"""
-        data = self.df.copy()
-        
         # Apply filters if provided
-        if filters:
-            if 'states' in filters:
-                data = data[data['State_Name'].isin(filters['states'])]
-            if 'years' in filters:
-                data = data[data['Year'].isin(filters['years'])]
+        conditions = _filter_conditions(filters)
         
         default_vars = [
             'GDP_Per_Capita',
@@ -32,8 +37,10 @@ class StatisticsService:
         
         vars_to_use = variables if variables else default_vars
         # Only use variables that exist in the dataframe
-        vars_to_use = [v for v in vars_to_use if v in data.columns]
-        numeric_data = data[vars_to_use].select_dtypes(include=[np.number])
+        columns = self.storage.get_columns()
+        vars_to_use = [v for v in vars_to_use if v in columns]
+        data = self.storage.query(columns=vars_to_use, conditions=conditions)
+        numeric_data = data.select_dtypes(include=[np.number])
         
         corr_matrix = numeric_data.corr()
         
@@ -48,17 +55,12 @@ class StatisticsService:
         filters: Optional[Dict] = None
     ) -> Dict:
         """Get statistical summary for a variable"""
-        data = self.df.copy()
-        
-        if filters:
-            if 'states' in filters:
-                data = data[data['State_Name'].isin(filters['states'])]
-            if 'years' in filters:
-                data = data[data['Year'].isin(filters['years'])]
-        
-        if variable not in data.columns:
+        if variable not in self.storage.get_columns():
             return {"error": f"Variable {variable} not found"}
         
+        data = self.storage.query(
+            columns=[variable], conditions=_filter_conditions(filters)
+        )
         values = pd.to_numeric(data[variable], errors='coerce').dropna()
         
         if len(values) == 0:
@@ -81,15 +83,15 @@ class StatisticsService:
         state: Optional[str] = None
     ) -> Dict:
         """Perform trend analysis on a variable over time"""
-        data = self.df.copy()
+        conditions = []
         
         if state:
-            data = data[data['State_Name'] == state]
+            conditions.append(('State_Name', '==', state))
         
-        if variable not in data.columns:
+        if variable not in self.storage.get_columns():
             return {"error": f"Variable {variable} not found"}
         
-        time_series = data.groupby('Year')[variable].mean().reset_index()
+        time_series = self.storage.aggregate(['Year'], {variable: 'mean'}, conditions)
         values = pd.to_numeric(time_series[variable], errors='coerce').dropna()
         years = time_series.loc[values.index, 'Year'].values
         
@@ -115,17 +117,14 @@ class StatisticsService:
         filters: Optional[Dict] = None
     ) -> List[Dict]:
         """Identify outliers in a variable"""
-        data = self.df.copy()
-        
-        if filters:
-            if 'states' in filters:
-                data = data[data['State_Name'].isin(filters['states'])]
-            if 'years' in filters:
-                data = data[data['Year'].isin(filters['years'])]
-        
-        if variable not in data.columns:
+        if variable not in self.storage.get_columns():
             return []
         
+        key_columns = ['State_Name', 'County_Clean', 'Year']
+        data = self.storage.query(
+            columns=list(dict.fromkeys(key_columns + [variable])),
+            conditions=_filter_conditions(filters)
+        )
         values = pd.to_numeric(data[variable], errors='coerce')
         
         if method == "iqr":
@@ -137,7 +136,7 @@ class StatisticsService:
             
             outliers = data[(values < lower_bound) | (values > upper_bound)]
         
-        return outliers[['State_Name', 'County_Clean', 'Year', variable]].to_dict('records')
+        return outliers[key_columns + [variable]].to_dict('records')
 
 stats_service = StatisticsService()
 
@@ -0,0 +1,557 @@
+import os
+import sqlite3
+import pandas as pd
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+
+# A filter condition is a (column, operator, value) triple, e.g.
+# ('State_Name', 'in', ['OHIO']) or ('GDP_Per_Capita', '>=', 40000)
+Condition = Tuple[str, str, Any]
+
+NUMERIC_COLUMNS = [
+    'Year', 'Population', 'Real_GDP', 'GDP_Per_Capita',
+    'Violent_Crime_Rate', 'Property_Crime_Rate', 'Total_Crime_Rate',
+    'Violent crime', 'Property crime', 'Burglary', 'Larceny-theft',
+    'Motor vehicle theft', 'Robbery', 'Aggravated assault',
+    'Murder and nonnegligent manslaughter', 'Forcible rape'
+]
+
+KEY_COLUMNS = ['State_Name', 'County_Clean', 'Year']
+
+SQL_OPERATORS = {'==': '=', '>=': '>=', '<=': '<='}
+
+SQL_AGGREGATES = {
+    'mean': 'AVG({col})',
+    'sum': 'COALESCE(SUM({col}), 0)',
+    'min': 'MIN({col})',
+    'max': 'MAX({col})',
+    'count': 'COUNT({col})'
+}
+
+def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce numeric columns and drop rows missing a key column"""
+    for col in NUMERIC_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    
+    return df.dropna(subset=KEY_COLUMNS)
+
+def column_types(df: pd.DataFrame) -> Dict[str, List[str]]:
+    """Split the columns of a frame into numeric and categorical ones"""
+    return {
+        "numeric": df.select_dtypes(include=['number']).columns.tolist(),
+        "categorical": df.select_dtypes(include=['object']).columns.tolist()
+    }
+
+def validate_aggregate(agg: Dict[str, str], text_columns: List[str]):
+    """Reject aggregates that no backend can answer meaningfully"""
+    if not agg:
+        raise ValueError("No columns to aggregate")
+    for column, func in agg.items():
+        if func in ('mean', 'sum') and column in text_columns:
+            raise ValueError(f"Cannot compute {func} of text column {column}")
+
+def condition_mask(df: pd.DataFrame, conditions: List[Condition]) -> pd.Series:
+    """Boolean mask of the rows of a frame matching all conditions"""
+    mask = pd.Series(True, index=df.index)
+    for column, op, value in conditions:
+        series = df[column]
+        if op == 'in':
+            mask &= series.isin(value)
+        elif op == '==':
+            mask &= series == value
+        elif op == '>=':
+            mask &= series >= value
+        elif op == '<=':
+            mask &= series <= value
+        else:
+            raise ValueError(f"Unsupported filter operator: {op}")
+    return mask
+
+class StorageBackend:
+    """Common interface for the dataset storage backends.
+    
+    Services never touch the raw dataset directly; they describe the rows
+    they need as a list of conditions and let the backend evaluate the
+    filter, projection and grouping where the data lives.
+    """
+    
+    def load_data(self) -> pd.DataFrame:
+        """Return the whole dataset as a DataFrame"""
+        return self.query()
+    
+    def open(self):
+        """Do any slow setup up front, before the first request"""
+    
+    def close(self):
+        """Release resources acquired by the backend"""
+    
+    def get_columns(self) -> List[str]:
+        raise NotImplementedError
+    
+    def get_column_types(self) -> Dict[str, List[str]]:
+        raise NotImplementedError
+    
+    def count_rows(self, conditions: Optional[List[Condition]] = None) -> int:
+        raise NotImplementedError
+    
+    def count_distinct(self, columns: List[str]) -> int:
+        """Count distinct non-null combinations of the given columns"""
+        raise NotImplementedError
+    
+    def get_range(self, column: str) -> Tuple[Any, Any]:
+        raise NotImplementedError
+    
+    def get_unique_values(
+        self,
+        column: str,
+        conditions: Optional[List[Condition]] = None
+    ) -> list:
+        raise NotImplementedError
+    
+    def query(
+        self,
+        columns: Optional[List[str]] = None,
+        conditions: Optional[List[Condition]] = None
+    ) -> pd.DataFrame:
+        """Return the rows matching all conditions, in dataset order"""
+        raise NotImplementedError
+    
+    def aggregate(
+        self,
+        by: List[str],
+        agg: Dict[str, str],
+        conditions: Optional[List[Condition]] = None
+    ) -> pd.DataFrame:
+        """Group the matching rows and aggregate, sorted by the group keys"""
+        raise NotImplementedError
+
+class PandasBackend(StorageBackend):
+    """Keeps the full dataset in a single in-memory DataFrame.
+    
+    Datasets of at least ``parallel_threshold`` rows are partitioned by
+    ``partition_column`` and filtered/aggregated on a pool of ``workers``
+    processes; smaller ones stay on the single-process path. The frame is
+    then kept sorted by partition, and rows are returned in dataset order
+    by their index labels.
+    """
+    
+    def __init__(
+        self,
+        data_path: str,
+        parallel_threshold: int,
+        workers: int,
+        partition_column: str = 'State_Name'
+    ):
+        self.data_path = Path(data_path)
+        self.parallel_threshold = parallel_threshold
+        self.workers = workers
+        self.partition_column = partition_column
+        self._data: Optional[pd.DataFrame] = None
+        self._executor = None
+    
+    @property
+    def df(self) -> pd.DataFrame:
+        if self._data is None:
+            if not self.data_path.exists():
+                raise FileNotFoundError(f"Data file not found at {self.data_path}")
+            
+            self._data = clean_data(pd.read_csv(self.data_path))
+        
+        return self._data
+    
+    def open(self):
+        """Read the CSV into memory and start the worker pool if it is used"""
+        executor = self._parallel()
+        if executor is not None:
+            executor.start()
+    
+    def load_data(self) -> pd.DataFrame:
+        return self.df.sort_index()
+    
+    def get_columns(self) -> List[str]:
+        return self.df.columns.tolist()
+    
+    def get_column_types(self) -> Dict[str, List[str]]:
+        return column_types(self.df)
+    
+    def count_rows(self, conditions: Optional[List[Condition]] = None) -> int:
+        if not conditions:
+            return len(self.df)
+        return int(condition_mask(self.df, conditions).sum())
+    
+    def count_distinct(self, columns: List[str]) -> int:
+        return int(self.df.groupby(columns).ngroups)
+    
+    def get_range(self, column: str) -> Tuple[Any, Any]:
+        return self.df[column].min(), self.df[column].max()
+    
+    def get_unique_values(
+        self,
+        column: str,
+        conditions: Optional[List[Condition]] = None
+    ) -> list:
+        values = self.df[column]
+        if conditions:
+            values = values[condition_mask(self.df, conditions)]
+        return sorted(values.dropna().unique().tolist())
+    
+    def query(
+        self,
+        columns: Optional[List[str]] = None,
+        conditions: Optional[List[Condition]] = None
+    ) -> pd.DataFrame:
+        # Started first, as the executor replaces the frame with a sorted one
+        executor = self._parallel()
+        data = self.df
+        if conditions:
+            positions = None
+            if executor is not None:
+                try:
+                    positions = executor.filter_positions(conditions)
+                except BrokenProcessPool:
+                    self.close()
+            if positions is not None:
+                data = data.take(positions)
+            else:
+                data = data[condition_mask(self.df, conditions)]
+        if columns is not None:
+            data = data[columns]
+        return data.sort_index()
+    
+    def aggregate(
+        self,
+        by: List[str],
+        agg: Dict[str, str],
+        conditions: Optional[List[Condition]] = None
+    ) -> pd.DataFrame:
+        validate_aggregate(
+            agg, self.df.select_dtypes(exclude=['number']).columns.tolist()
+        )
+        
+        executor = self._parallel()
+        if executor is not None and executor.supports(agg):
+            try:
+                result = executor.aggregate(by, agg, conditions or [])
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); answer on this process
+                # and start a fresh pool on the next call
+                self.close()
+                result = None
+            if result is not None:
+                return result
+        
+        data = self.df
+        if conditions:
+            data = data[condition_mask(self.df, conditions)]
+        return data.groupby(by).agg(agg).reset_index()
+    
+    def close(self):
+        """Shut down the worker processes, if any were started"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _parallel(self):
+        """Process-pool executor, used once the dataset reaches the threshold"""
+        if self.workers < 2 or len(self.df) < self.parallel_threshold:
+            return None
+        if self._executor is None:
+            # Imported here because the executor evaluates conditions with
+            # condition_mask from this module
+            from app.services.parallel import PartitionedExecutor
+            self._executor = PartitionedExecutor(
+                self.df, self.partition_column, self.workers
+            )
+            # Keep only the partition-sorted copy the workers share
+            self._data = self._executor.data
+        return self._executor
+
+class SQLiteBackend(StorageBackend):
+    """Keeps the dataset in an indexed on-disk SQLite table.
+    
+    The CSV is ingested chunk by chunk on first use, so it never has to fit
+    in memory. Filters, groupbys and aggregates are compiled to SQL and
+    results are streamed back in chunks of ``chunk_size`` rows.
+    """
+    
+    TABLE = 'crime_data'
+    COLUMNS_TABLE = 'column_kinds'
+    INDEXES = [
+        ['State_Name'],
+        ['Year'],
+        ['State_Name', 'County_Clean'],
+        ['State_Name', 'Year']
+    ]
+    
+    def __init__(self, data_path: str, db_path: str, chunk_size: int):
+        self.data_path = Path(data_path)
+        self.db_path = Path(db_path)
+        self.chunk_size = chunk_size
+        self._kinds: Optional[Dict[str, str]] = None
+        self._ready = False
+    
+    @property
+    def kinds(self) -> Dict[str, str]:
+        """Column name -> 'int', 'float' or 'text', in dataset order"""
+        if self._kinds is None:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT name, kind FROM {self.COLUMNS_TABLE} ORDER BY position"
+                ).fetchall()
+            self._kinds = dict(rows)
+        return self._kinds
+    
+    def open(self):
+        """Build the database, if needed, before the first request"""
+        self.kinds
+    
+    def get_columns(self) -> List[str]:
+        return list(self.kinds)
+    
+    def get_column_types(self) -> Dict[str, List[str]]:
+        sample = self._read(f"SELECT * FROM {self.TABLE} LIMIT 1", [], self.kinds)
+        return column_types(sample)
+    
+    def count_rows(self, conditions: Optional[List[Condition]] = None) -> int:
+        where, params = self._where(conditions)
+        return self._scalar(f"SELECT COUNT(*) FROM {self.TABLE}{where}", params)
+    
+    def count_distinct(self, columns: List[str]) -> int:
+        cols = ', '.join(_quote(c) for c in columns)
+        not_null = ' AND '.join(f"{_quote(c)} IS NOT NULL" for c in columns)
+        return self._scalar(
+            f"SELECT COUNT(*) FROM (SELECT DISTINCT {cols} FROM {self.TABLE} "
+            f"WHERE {not_null})",
+            []
+        )
+    
+    def get_range(self, column: str) -> Tuple[Any, Any]:
+        col = _quote(column)
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                f"SELECT MIN({col}), MAX({col}) FROM {self.TABLE}"
+            ).fetchone()
+    
+    def get_unique_values(
+        self,
+        column: str,
+        conditions: Optional[List[Condition]] = None
+    ) -> list:
+        col = _quote(column)
+        where, params = self._where(
+            list(conditions or []), extra=[f"{col} IS NOT NULL"]
+        )
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT {col} FROM {self.TABLE}{where}", params
+            ).fetchall()
+        return sorted(row[0] for row in rows)
+    
+    def query(
+        self,
+        columns: Optional[List[str]] = None,
+        conditions: Optional[List[Condition]] = None
+    ) -> pd.DataFrame:
+        if columns is None:
+            columns = self.get_columns()
+        if not columns:
+            return pd.DataFrame(index=range(self.count_rows(conditions)))
+        select = ', '.join(_quote(c) for c in columns)
+        where, params = self._where(conditions)
+        sql = f"SELECT {select} FROM {self.TABLE}{where} ORDER BY rowid"
+        return self._read(sql, params, {c: self.kinds[c] for c in columns})
+    
+    def aggregate(
+        self,
+        by: List[str],
+        agg: Dict[str, str],
+        conditions: Optional[List[Condition]] = None
+    ) -> pd.DataFrame:
+        validate_aggregate(
+            agg, [c for c, kind in self.kinds.items() if kind == 'text']
+        )
+        
+        keys = ', '.join(_quote(c) for c in by)
+        select = [_quote(c) for c in by]
+        kinds = {c: self.kinds[c] for c in by}
+        
+        for column, func in agg.items():
+            if func not in SQL_AGGREGATES:
+                raise ValueError(f"Unsupported aggregate: {func}")
+            expr = SQL_AGGREGATES[func].format(col=_quote(column))
+            select.append(f"{expr} AS {_quote(column)}")
+            if func == 'mean':
+                kinds[column] = 'float'
+            elif func == 'count':
+                kinds[column] = 'int'
+            else:
+                kinds[column] = self.kinds[column]
+        
+        where, params = self._where(
+            conditions, extra=[f"{_quote(c)} IS NOT NULL" for c in by]
+        )
+        sql = (
+            f"SELECT {', '.join(select)} FROM {self.TABLE}{where} "
+            f"GROUP BY {keys} ORDER BY {keys}"
+        )
+        return self._read(sql, params, kinds)
+    
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3.connect creates a missing file, so the database has to be
+        # built before the first connection or ingest would be skipped
+        if not self._ready:
+            self._ensure_database()
+            self._ready = True
+        return sqlite3.connect(self.db_path)
+    
+    def _ensure_database(self):
+        """Build the database from the CSV if it is missing or out of date"""
+        if not self.data_path.exists():
+            raise FileNotFoundError(f"Data file not found at {self.data_path}")
+        
+        if (
+            self.db_path.exists()
+            and self.db_path.stat().st_mtime >= self.data_path.stat().st_mtime
+            and self._is_built()
+        ):
+            return
+        
+        # Each process builds into its own file and renames it into place
+        # atomically, so concurrent workers never write to the same file
+        tmp_path = self.db_path.with_name(f"{self.db_path.name}.{os.getpid()}.tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+        
+        with closing(sqlite3.connect(tmp_path)) as conn:
+            columns: List[str] = []
+            for chunk in pd.read_csv(self.data_path, chunksize=self.chunk_size):
+                chunk = clean_data(chunk)
+                columns = chunk.columns.tolist()
+                chunk.to_sql(self.TABLE, conn, if_exists='append', index=False)
+            
+            for index_columns in self.INDEXES:
+                name = 'idx_' + '_'.join(c.lower() for c in index_columns)
+                cols = ', '.join(_quote(c) for c in index_columns)
+                conn.execute(f"CREATE INDEX {name} ON {self.TABLE} ({cols})")
+            
+            conn.execute(
+                f"CREATE TABLE {self.COLUMNS_TABLE} "
+                f"(position INTEGER, name TEXT, kind TEXT)"
+            )
+            for position, column in enumerate(columns):
+                conn.execute(
+                    f"INSERT INTO {self.COLUMNS_TABLE} VALUES (?, ?, ?)",
+                    (position, column, self._detect_kind(conn, column))
+                )
+            conn.commit()
+        
+        tmp_path.replace(self.db_path)
+    
+    def _is_built(self) -> bool:
+        """Whether the database file holds a completed ingest"""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (self.COLUMNS_TABLE,)
+            ).fetchone()
+        return row[0] > 0
+    
+    def _detect_kind(self, conn: sqlite3.Connection, column: str) -> str:
+        """Recover the pandas dtype a column would have had in memory"""
+        col = _quote(column)
+        has_text, has_real, has_null = conn.execute(
+            f"SELECT MAX(typeof({col}) = 'text'), MAX(typeof({col}) = 'real'), "
+            f"MAX({col} IS NULL) FROM {self.TABLE}"
+        ).fetchone()
+        if has_text:
+            return 'text'
+        if has_real or has_null:
+            return 'float'
+        return 'int'
+    
+    def _where(
+        self,
+        conditions: Optional[List[Condition]],
+        extra: Optional[List[str]] = None
+    ) -> Tuple[str, list]:
+        clauses = list(extra or [])
+        params: list = []
+        
+        for column, op, value in conditions or []:
+            col = _quote(column)
+            if op == 'in':
+                values = list(value)
+                if not values:
+                    clauses.append('0')
+                    continue
+                clauses.append(f"{col} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+            elif op in SQL_OPERATORS:
+                clauses.append(f"{col} {SQL_OPERATORS[op]} ?")
+                params.append(value)
+            else:
+                raise ValueError(f"Unsupported filter operator: {op}")
+        
+        if not clauses:
+            return '', params
+        return ' WHERE ' + ' AND '.join(clauses), params
+    
+    def _scalar(self, sql: str, params: list) -> Any:
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchone()[0]
+    
+    def _read(self, sql: str, params: list, kinds: Dict[str, str]) -> pd.DataFrame:
+        """Stream a query result back in chunks and restore column dtypes"""
+        chunks = []
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(sql, params)
+            columns = [d[0] for d in cursor.description]
+            while True:
+                rows = cursor.fetchmany(self.chunk_size)
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame.from_records(rows, columns=columns))
+        
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=columns)
+        
+        for column in columns:
+            kind = kinds.get(column)
+            if kind == 'float':
+                df[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+            elif kind == 'int':
+                df[column] = df[column].astype('int64')
+            elif kind == 'text' and df.empty:
+                # Match the dtype pandas infers for a column of strings
+                df[column] = df[column].astype(str)
+        
+        return df
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+def get_storage_backend() -> StorageBackend:
+    """Create the storage backend selected in settings"""
+    backend = settings.STORAGE_BACKEND.lower()
+    
+    if backend == 'pandas':
+        return PandasBackend(
+            settings.DATA_FILE_PATH,
+            settings.PARALLEL_ROW_THRESHOLD,
+            settings.PARALLEL_WORKERS or os.cpu_count() or 1,
+            settings.PARALLEL_PARTITION_COLUMN
+        )
+    if backend == 'sqlite':
+        return SQLiteBackend(
+            settings.DATA_FILE_PATH,
+            settings.SQLITE_DB_PATH,
+            settings.STORAGE_CHUNK_SIZE
+        )
+    
+    raise ValueError(f"Unknown storage backend: {settings.STORAGE_BACKEND}")
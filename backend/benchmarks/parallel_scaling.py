@@ -0,0 +1,100 @@
+"""Report how partition-parallel filter/groupby execution scales with cores.
+
+Builds a synthetic dataset by stacking copies of the bundled CSV with the
+years shifted, then times the state/year aggregates and a range filter on
+the single-process path (one core) and on process pools of 2..N workers.
+
+Usage (from the backend directory):
+    python -m benchmarks.parallel_scaling --copies 100 --max-workers 8
+"""
+import argparse
+import os
+import tempfile
+import time
+import pandas as pd
+from pathlib import Path
+from app.config import settings
+from app.services.storage import PandasBackend
+
+AGGREGATES = {
+    'Violent_Crime_Rate': 'mean',
+    'Property_Crime_Rate': 'mean',
+    'GDP_Per_Capita': 'mean',
+    'Population': 'sum',
+    'Violent crime': 'sum',
+    'Property crime': 'sum'
+}
+
+CONDITIONS = [
+    ('GDP_Per_Capita', '>=', 30000),
+    ('Violent_Crime_Rate', '<=', 400)
+]
+
+def build_dataset(copies: int, path: Path):
+    df = pd.read_csv(settings.DATA_FILE_PATH)
+    span = int(df['Year'].max() - df['Year'].min() + 1)
+    frames = []
+    for i in range(copies):
+        frame = df.copy()
+        frame['Year'] = frame['Year'] + i * span
+        frames.append(frame)
+    pd.concat(frames, ignore_index=True).to_csv(path, index=False)
+
+def time_call(func, repeats: int) -> float:
+    func()  # warm-up: starts the pool and fills caches
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run(backend: PandasBackend, repeats: int) -> dict:
+    return {
+        'by_state': time_call(
+            lambda: backend.aggregate(['State_Name'], AGGREGATES), repeats
+        ),
+        'by_year': time_call(
+            lambda: backend.aggregate(['Year'], AGGREGATES), repeats
+        ),
+        'filter': time_call(
+            lambda: backend.query(conditions=CONDITIONS), repeats
+        )
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--copies', type=int, default=100)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'synthetic.csv'
+        build_dataset(args.copies, path)
+        
+        single = PandasBackend(str(path), parallel_threshold=0, workers=1)
+        print(f"rows: {len(single.df):,}")
+        baseline = run(single, args.repeats)
+        
+        print(f"{'mode':<12}{'by_state':>12}{'by_year':>12}{'filter':>12}")
+        print(f"{'1 (single)':<12}" + ''.join(
+            f"{baseline[name]:>11.3f}s" for name in baseline
+        ))
+        
+        for workers in range(2, args.max_workers + 1):
+            backend = PandasBackend(
+                str(path),
+                parallel_threshold=0,
+                workers=workers,
+                partition_column=settings.PARALLEL_PARTITION_COLUMN
+            )
+            timings = run(backend, args.repeats)
+            backend.close()
+            print(f"{f'{workers} workers':<12}" + ''.join(
+                f"{timings[name]:>7.3f}s {baseline[name] / timings[name]:>3.1f}x"
+                for name in timings
+            ))
+
+if __name__ == '__main__':
+    main()
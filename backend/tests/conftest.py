@@ -0,0 +1,76 @@
+import math
+import pytest
+from fastapi.testclient import TestClient
+from app.config import settings
+from app.main import app
+from app.services.aggregator import aggregator
+from app.services.data_filter import data_filter
+from app.services.data_loader import DataLoader
+from app.services.statistics import stats_service
+from app.services.storage import PandasBackend, SQLiteBackend
+
+def make_pandas_backend() -> PandasBackend:
+    return PandasBackend(settings.DATA_FILE_PATH, parallel_threshold=0, workers=1)
+
+def make_parallel_backend(partition_column: str = "State_Name") -> PandasBackend:
+    return PandasBackend(
+        settings.DATA_FILE_PATH,
+        parallel_threshold=1,
+        workers=2,
+        partition_column=partition_column
+    )
+
+def make_sqlite_backend(db_path) -> SQLiteBackend:
+    return SQLiteBackend(settings.DATA_FILE_PATH, str(db_path), chunk_size=1000)
+
+@pytest.fixture(scope="session")
+def reference():
+    """Single-process in-memory backend every other backend is checked against"""
+    return make_pandas_backend()
+
+@pytest.fixture
+def client():
+    return TestClient(app, raise_server_exceptions=False)
+
+@pytest.fixture
+def install(monkeypatch):
+    """Point the data loader and every service at the given backend"""
+    def install_backend(backend):
+        monkeypatch.setattr(DataLoader, "_storage", backend)
+        for service in (data_filter, aggregator, stats_service):
+            monkeypatch.setattr(service, "storage", backend)
+    return install_backend
+
+def assert_json_close(expected, actual, path="$"):
+    """Compare decoded JSON, allowing float rounding differences"""
+    if isinstance(expected, float) or isinstance(actual, float):
+        assert expected is not None and actual is not None, path
+        assert math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9), (
+            f"{path}: {expected} != {actual}"
+        )
+    elif isinstance(expected, dict):
+        assert isinstance(actual, dict), path
+        assert list(expected) == list(actual), path
+        for key in expected:
+            assert_json_close(expected[key], actual[key], f"{path}.{key}")
+    elif isinstance(expected, list):
+        assert isinstance(actual, list), path
+        assert len(expected) == len(actual), path
+        for i, (a, b) in enumerate(zip(expected, actual)):
+            assert_json_close(a, b, f"{path}[{i}]")
+    else:
+        assert expected == actual, f"{path}: {expected!r} != {actual!r}"
+
+BACKENDS = {
+    "pandas": lambda tmp: make_pandas_backend(),
+    "sqlite": lambda tmp: make_sqlite_backend(tmp / "conformance.sqlite"),
+    "parallel-state": lambda tmp: make_parallel_backend("State_Name"),
+    "parallel-year": lambda tmp: make_parallel_backend("Year"),
+}
+
+@pytest.fixture(scope="session", params=list(BACKENDS))
+def backend(request, tmp_path_factory):
+    """Each storage backend under test, built once per session"""
+    instance = BACKENDS[request.param](tmp_path_factory.mktemp(request.param))
+    yield instance
+    instance.close()
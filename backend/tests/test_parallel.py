@@ -0,0 +1,109 @@
+import os
+import signal
+import numpy as np
+import pandas as pd
+from app.main import app
+from app.services import parallel
+from fastapi.testclient import TestClient
+from tests.conftest import make_parallel_backend
+
+AGGREGATES = {"Violent_Crime_Rate": "mean", "Population": "sum"}
+
+def test_broken_pool_falls_back_to_single_process(reference):
+    backend = make_parallel_backend()
+    try:
+        expected = reference.aggregate(["State_Name"], AGGREGATES)
+        pd.testing.assert_frame_equal(
+            expected, backend.aggregate(["State_Name"], AGGREGATES)
+        )
+
+        # Simulate an OOM kill of one worker. The pool then terminates the
+        # others itself, so only the first one is killed here
+        process = next(iter(backend._executor.pool._processes.values()))
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+
+        conditions = [("Year", "==", 2012)]
+        pd.testing.assert_frame_equal(
+            expected, backend.aggregate(["State_Name"], AGGREGATES)
+        )
+        assert backend._executor is None
+        pd.testing.assert_frame_equal(
+            reference.query(conditions=conditions),
+            backend.query(conditions=conditions)
+        )
+    finally:
+        backend.close()
+
+def test_lifespan_starts_and_stops_worker_pool(install):
+    backend = make_parallel_backend()
+    install(backend)
+
+    with TestClient(app):
+        assert backend._executor is not None
+        pool = backend._executor.pool
+        # Workers are forked at startup, not by the first request
+        assert len(pool._processes) == backend.workers
+
+    assert backend._executor is None
+    assert pool._shutdown_thread
+
+def test_partitions_are_pruned_by_partition_column():
+    backend = make_parallel_backend()
+    try:
+        executor = backend._parallel()
+        assert executor._prune([("State_Name", "in", ["OHIO", "TEXAS"])]) == [
+            key for key in executor.partitions if key in ("OHIO", "TEXAS")
+        ]
+        assert executor._prune([("State_Name", "==", "OHIO")]) == ["OHIO"]
+        assert executor._prune([("State_Name", "in", [])]) == []
+        assert len(executor._prune([("Year", "==", 2012)])) == len(executor.partitions)
+    finally:
+        backend.close()
+
+def test_partitions_are_zero_copy_slices_of_sorted_data(reference):
+    backend = make_parallel_backend()
+    try:
+        executor = backend._parallel()
+        data = executor.data
+        assert backend.df is data
+        for key, (start, stop) in executor.partitions.items():
+            assert (data["State_Name"].iloc[start:stop] == key).all()
+        assert sum(stop - start for start, stop in executor.partitions.values()) == len(data)
+
+        parallel._init_worker(data, executor.partitions)
+        _, part = next(parallel._slices(["OHIO"]))
+        assert np.shares_memory(
+            part["Population"].to_numpy(), data["Population"].to_numpy()
+        )
+
+        # The index labels restore dataset order
+        pd.testing.assert_frame_equal(reference.load_data(), backend.load_data())
+    finally:
+        parallel._init_worker(None, {})
+        backend.close()
+
+def test_mean_is_merged_from_partial_sums_and_counts(reference):
+    # Partitioned by year, each state's mean spans several partitions
+    backend = make_parallel_backend("Year")
+    try:
+        pd.testing.assert_frame_equal(
+            reference.aggregate(["State_Name"], {"GDP_Per_Capita": "mean"}),
+            backend._parallel().aggregate(["State_Name"], {"GDP_Per_Capita": "mean"}, []),
+            check_exact=False,
+            rtol=1e-12
+        )
+    finally:
+        backend.close()
+
+def test_no_matching_rows_falls_back_to_single_process(reference):
+    backend = make_parallel_backend()
+    conditions = [("State_Name", "==", "NOWHERE")]
+    try:
+        assert backend._parallel().aggregate(["Year"], AGGREGATES, conditions) is None
+        pd.testing.assert_frame_equal(
+            reference.aggregate(["Year"], AGGREGATES, conditions),
+            backend.aggregate(["Year"], AGGREGATES, conditions)
+        )
+    finally:
+        backend.close()
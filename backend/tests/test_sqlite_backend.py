@@ -0,0 +1,55 @@
+import multiprocessing
+from fastapi.testclient import TestClient
+from app.main import app
+from tests.conftest import assert_json_close, make_sqlite_backend
+
+def test_cold_start_builds_database_on_first_query(tmp_path, client, install, reference):
+    install(reference)
+    expected = client.get("/api/data/summary").json()
+
+    # /summary never touches the column metadata, so it must build the
+    # database itself instead of connecting to an empty file
+    backend = make_sqlite_backend(tmp_path / "cold.sqlite")
+    install(backend)
+    response = client.get("/api/data/summary")
+
+    assert response.status_code == 200
+    assert_json_close(expected, response.json())
+    assert client.get("/api/data/columns").status_code == 200
+
+def test_empty_database_file_is_rebuilt(tmp_path, client, install, reference):
+    install(reference)
+    expected = client.get("/api/data/summary").json()
+
+    db_path = tmp_path / "stale.sqlite"
+    db_path.touch()
+    install(make_sqlite_backend(db_path))
+    response = client.get("/api/data/summary")
+
+    assert response.status_code == 200
+    assert_json_close(expected, response.json())
+
+def test_open_builds_database_at_startup(tmp_path, install):
+    db_path = tmp_path / "startup.sqlite"
+    install(make_sqlite_backend(db_path))
+
+    with TestClient(app):
+        assert db_path.exists()
+
+def test_concurrent_builds_do_not_share_a_temp_file(tmp_path, reference):
+    db_path = tmp_path / "shared.sqlite"
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=lambda: make_sqlite_backend(db_path).open())
+        for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert list(tmp_path.glob("*.tmp")) == []
+    backend = make_sqlite_backend(db_path)
+    assert backend.count_rows() == reference.count_rows()
+    assert backend.get_columns() == reference.get_columns()